@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 from distutils.core import Command
+from distutils.spawn import find_executable
 import os
+import subprocess
 from future.utils import text_to_native_str
 
 from ._nativize import nativize_all
@@ -66,16 +68,20 @@ class build_docs(Command):
                                  'template': 'documentation/_templates/empty.tex'
                              })
 
-            savedir = os.getcwd()
-            
-            os.chdir(outdir)
-                
-            os.system("pdflatex fipy")
-            os.system("pdflatex fipy")
-            os.system("pdflatex fipy")
-            os.system("makeindex -s python.ist fipy")
-            os.system("makeindex -s python.ist modfipy")
-            os.system("pdflatex fipy")
-            os.system("pdflatex fipy")
-                
-            os.chdir(savedir)
+            def latex(*args):
+                subprocess.check_call([text_to_native_str(arg) for arg in args],
+                                      cwd=outdir)
+
+            if find_executable("latexmk") is not None:
+                # runs pdflatex only until references converge; Sphinx
+                # writes a latexmkrc that applies python.ist to the index
+                latex("latexmk", "-pdf", "-interaction=nonstopmode", "fipy")
+            else:
+                latex("pdflatex", "fipy")
+                latex("pdflatex", "fipy")
+                latex("pdflatex", "fipy")
+                latex("makeindex", "-s", "python.ist", "fipy")
+                if os.path.exists(os.path.join(outdir, "modfipy.idx")):
+                    latex("makeindex", "-s", "python.ist", "modfipy")
+                latex("pdflatex", "fipy")
+                latex("pdflatex", "fipy")
@@ -108,6 +108,8 @@ class changelog(Command):
         if tagOrSHA is None:
             date = tagOrSHA
         else:
+            import github
+
             tags = self.repo.get_tags()
             tags = [tag for tag in tags if tag.name == tagOrSHA]
             try:
@@ -116,7 +118,7 @@ class changelog(Command):
                 try:
                     commit = self.repo.get_commit(tagOrSHA)
                     date = commit.commit.author.date
-                except:
+                except github.GithubException:
                     date = tagOrSHA
 
         return date
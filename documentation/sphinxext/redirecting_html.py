@@ -28,3 +28,7 @@ class RedirectingHTMLBuilder(StandaloneHTMLBuilder):
 
 def setup(app):
     app.add_builder(RedirectingHTMLBuilder)
+
+    # `write_doc` only rewrites the doctree it is handed
+    return {'parallel_read_safe': True,
+            'parallel_write_safe': True}
@@ -209,7 +209,7 @@ class test(_test):
                 ## the order in which modules are imported
                 try:
                     import scipy
-                except:
+                except ImportError:
                     pass
                 import PyTrilinos
             except ImportError as a:
@@ -294,7 +294,7 @@ class test(_test):
                 from mpi4py import MPI
                 procID = MPI.COMM_WORLD.rank
                 barrier = MPI.COMM_WORLD.barrier
-            except:
+            except ImportError:
                 procID = 0
                 def barrier(*args):
                     pass
@@ -14,9 +14,26 @@ def _ConstraintMask(var):
             self.var = var
 
         def _calcValue(self):
-            returnMask = numerix.zeros(self.shape, dtype=bool)
-            for constraint in self.var.constraints:
-                returnMask = returnMask | numerix.asarray(constraint.where)
+            wheres = [numerix.asarray(constraint.where)
+                      for constraint in self.var.constraints]
+            if len(wheres) == 0:
+                return numerix.zeros(self.shape, dtype=bool)
+
+            # a full-shape `where` on a higher-rank variable grows the mask
+            shape = self.shape
+            for where in wheres:
+                shape = numerix._broadcastShape(shape, where.shape)
+                if shape is None:
+                    raise ValueError("`where` of shape %s cannot broadcast "
+                                     "to constraint mask shape %s"
+                                     % (where.shape, self.shape))
+
+            # seed the mask from the first constraint rather than OR-ing
+            # it against an all-False array, then accumulate in place
+            returnMask = numerix.empty(shape, dtype=bool)
+            returnMask[...] = wheres[0]
+            for where in wheres[1:]:
+                numerix.logical_or(returnMask, where, out=returnMask)
             return returnMask
 
     return _ConstraintMaskVariable(var)
@@ -243,6 +243,13 @@ class DistanceVariable(CellVariable):
 
         """
         CellVariable.__init__(self, mesh, name = name, value = value, unit = unit, hasOld = hasOld)
+
+        ## the mesh topology is fixed for the life of this variable, but
+        ## some meshes rebuild these arrays on every access
+        self._adjacentCellIDs = self.mesh._adjacentCellIDs
+        self._cellFaceIDs = self.mesh.cellFaceIDs
+        self._exteriorFaceMask = numerix.array(self.mesh.exteriorFaces, dtype=bool)
+
         self._markStale()
 
     def _calcValue(self):
@@ -394,18 +401,42 @@ class DistanceVariable(CellVariable):
            >>> print(numerix.allclose(distanceVariable._cellInterfaceNormals, answer))
            True
 
+        On a mixed mesh the triangles' missing fourth face comes back as
+        zero in a plain array, and the interface areas are unaffected:
+
+           >>> from fipy.meshes import Tri2D
+           >>> mesh = Grid2D(nx=3, ny=3) + (Tri2D(nx=2, ny=2) + ((3,), (0,)))
+           >>> distanceVariable = DistanceVariable(mesh=mesh,
+           ...                                     value=1.7 - mesh.y)
+           >>> normals = distanceVariable._cellInterfaceNormals
+           >>> print(type(normals) is numerix.ndarray)
+           True
+           >>> print(numerix.allclose(normals[..., 3, 9:], 0))
+           True
+           >>> a, b = 0.46772176, 0.49298615
+           >>> answer = CellVariable(mesh=mesh,
+           ...                       value=(0, 0, 0, 1, 1, 1, 0, 0, 0,
+           ...                              0, 0, a, a, 0, 0, 0, 0,
+           ...                              0, 0, b, b, 0, 0, 0, 0))
+           >>> print(numerix.allclose(distanceVariable.cellInterfaceAreas, answer))
+           True
+
         """
 
         dim = self.mesh.dim
 
-        valueOverFaces = numerix.repeat(self._cellValueOverFaces[numerix.newaxis, ...], dim, axis=0)
-        cellFaceIDs = self.mesh.cellFaceIDs
+        cellFaceIDs = self._cellFaceIDs
+        valueOverFaces = numerix.broadcast_to(
+            self._cellValueOverFaces[numerix.newaxis, ...],
+            (dim,) + cellFaceIDs.shape)
         if cellFaceIDs.shape[-1] > 0:
-            interfaceNormals = self._interfaceNormals[..., cellFaceIDs]
+            interfaceNormals = self._interfaceNormals[..., MA.filled(cellFaceIDs, 0)]
         else:
             interfaceNormals = 0
 
-        return MA.where(valueOverFaces < 0, 0, interfaceNormals)
+        ## zero the missing faces here so callers get a plain array
+        zeroed = (valueOverFaces < 0) | MA.getmaskarray(cellFaceIDs)
+        return numerix.where(zeroed, 0, interfaceNormals)
 
     @property
     def _interfaceNormals(self):
@@ -427,8 +458,7 @@ class DistanceVariable(CellVariable):
 
         """
 
-        M = self.mesh.dim
-        interfaceFlag = numerix.repeat(self._interfaceFlag[numerix.newaxis, ...], M, axis=0)
+        interfaceFlag = self._interfaceFlag[numerix.newaxis, ...]
         return numerix.where(interfaceFlag, self._levelSetNormals, 0)
 
     @property
@@ -447,12 +477,32 @@ class DistanceVariable(CellVariable):
            >>> print(numerix.allclose(distanceVariable._interfaceFlag, answer))
            True
 
+        A sign change between very small values is still an interface,
+        even though their product underflows to zero. Faces touching a
+        value of exactly `0.` or `-0.` are not.
+
+           >>> from fipy.meshes import Grid1D
+           >>> mesh = Grid1D(nx = 4)
+           >>> distanceVariable = DistanceVariable(mesh = mesh,
+           ...                                     value = (-1e-200, 1e-200, 0., -0.))
+           >>> print(distanceVariable._interfaceFlag)
+           [0 1 0 0 0]
+           >>> distanceVariable = DistanceVariable(mesh = mesh,
+           ...                                     value = (-1., 0., 1., -0.))
+           >>> print(distanceVariable._interfaceFlag)
+           [0 0 0 0 0]
+
         """
-        adjacentCellIDs = self.mesh._adjacentCellIDs
+        adjacentCellIDs = self._adjacentCellIDs
         val0 = numerix.take(numerix.array(self._value), adjacentCellIDs[0])
         val1 = numerix.take(numerix.array(self._value), adjacentCellIDs[1])
 
-        return numerix.where(val1 * val0 < 0, 1, 0)
+        ## compare sign bits rather than testing `val1 * val0 < 0`, which
+        ## underflows to zero for very small level set values
+        flag = numerix.signbit(val0) ^ numerix.signbit(val1)
+        flag &= (val0 != 0) & (val1 != 0)
+
+        return numerix.where(flag, 1, 0)
 
     @property
     def _cellInterfaceFlag(self):
@@ -469,6 +519,16 @@ class DistanceVariable(CellVariable):
         >>> print(numerix.allclose(distanceVariable._cellInterfaceFlag, answer))
         True
 
+        Triangles on a mixed mesh have a missing face, which must not
+        flag the positive cells away from the interface:
+
+        >>> from fipy.meshes import Tri2D
+        >>> mesh = Grid2D(nx=3, ny=3) + (Tri2D(nx=2, ny=2) + ((3,), (0,)))
+        >>> distanceVariable = DistanceVariable(mesh=mesh,
+        ...                                     value=1.7 - mesh.y)
+        >>> print(distanceVariable._cellInterfaceFlag)
+        [0 0 0 1 1 1 0 0 0 0 0 1 1 0 0 0 0 0 0 1 1 0 0 0 0]
+
         """
         from fipy.variables.interfaceFlagVariable import _InterfaceFlagVariable
         return _InterfaceFlagVariable(self)
@@ -494,9 +554,8 @@ class DistanceVariable(CellVariable):
 
         """
 
-        M = self.mesh._maxFacesPerCell
-        N = self.mesh.numberOfCells
-        return numerix.reshape(numerix.repeat(numerix.array(self._value)[numerix.newaxis, ...], M, axis=0), (M, N))
+        return numerix.broadcast_to(numerix.array(self._value)[numerix.newaxis, ...],
+                                    self._cellFaceIDs.shape)
 
     @property
     def _levelSetNormals(self):
@@ -517,19 +576,12 @@ class DistanceVariable(CellVariable):
            True
         """
 
-        faceGrad = self.grad.arithmeticFaceValue
-        faceGradMag = numerix.array(faceGrad.mag)
-        faceGradMag = numerix.where(faceGradMag > 1e-10,
-                                    faceGradMag,
-                                    1e-10)
-        faceGrad = numerix.array(faceGrad)
-
-        ## set faceGrad zero on exteriorFaces
-        exteriorFaces = self.mesh.exteriorFaces
-        if len(exteriorFaces.value) > 0:
-            faceGrad[..., exteriorFaces.value] = 0.
+        faceGrad = numerix.array(self.grad.arithmeticFaceValue)
+        faceGradMag = numerix.sqrt(numerix.einsum('ij,ij->j', faceGrad, faceGrad))
+        faceGradMag = numerix.maximum(faceGradMag, 1e-10)
 
-        return faceGrad / faceGradMag
+        ## normalize and set faceGrad zero on exteriorFaces in one pass
+        return numerix.where(self._exteriorFaceMask, 0., faceGrad / faceGradMag)
 
 def _test():
     import fipy.tests.doctestPlus
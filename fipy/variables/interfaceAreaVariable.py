@@ -20,6 +20,7 @@ class _InterfaceAreaVariable(CellVariable):
         self.distanceVar = self._requires(distanceVar)
 
     def _calcValue(self):
-        normals = numerix.array(MA.filled(self.distanceVar._cellInterfaceNormals, 0))
+        normals = self.distanceVar._cellInterfaceNormals
         areas = numerix.array(MA.filled(self.mesh._cellAreaProjections, 0))
-        return numerix.sum(abs(numerix.dot(normals, areas)), axis=0)
+        projections = numerix.einsum('ijk,ijk->jk', normals, areas)
+        return numerix.sum(numerix.absolute(projections, out=projections), axis=0)
@@ -20,6 +20,10 @@ class _InterfaceFlagVariable(CellVariable):
         self.distanceVar = self._requires(distanceVar)
 
     def _calcValue(self):
-        flag = MA.filled(numerix.take(self.distanceVar._interfaceFlag, self.mesh.cellFaceIDs), 0)
-        flag = numerix.sum(flag, axis=0)
+        ## point missing faces at a trailing zero sentinel instead of
+        ## carrying a mask through the take
+        faceFlag = self.distanceVar._interfaceFlag
+        faceFlag = numerix.append(faceFlag, 0)
+        cellFaceIDs = MA.filled(self.distanceVar._cellFaceIDs, len(faceFlag) - 1)
+        flag = numerix.sum(numerix.take(faceFlag, cellFaceIDs), axis=0)
         return numerix.where(numerix.logical_and(self.distanceVar.value > 0, flag > 0), 1, 0)
@@ -184,6 +184,40 @@ class _MeshVariable(Variable):
         >>> print(v1)
         [ 1.  0.  0.  3.]
 
+        A full-shape `where` on a vector variable gives a full-shape mask,
+        which grows as constraints with either shape are added.
+
+        >>> m = Grid2D(nx=3, ny=2)
+        >>> x, y = m.cellCenters
+        >>> v2 = CellVariable(mesh=m, rank=1, value=((0.,), (0.,)))
+        >>> v2.constrain(1., where=numerix.array([x < 1, y > 1]))
+        >>> print(v2.constraintMask)
+        [[ True False False  True False False]
+         [False False False  True  True  True]]
+        >>> v2.constrain(2., where=numerix.array([x > 2, y < 1]))
+        >>> print(v2.constraintMask)
+        [[ True False  True  True False  True]
+         [ True  True  True  True  True  True]]
+        >>> v2.constrain(3., where=(x > 1) & (x < 2))
+        >>> print(v2.constraintMask)
+        [[ True  True  True  True  True  True]
+         [ True  True  True  True  True  True]]
+        >>> print(numerix.allclose(v2, ((1., 3., 2., 1., 3., 2.),
+        ...                             (2., 3., 2., 1., 3., 1.))))
+        True
+
+        A `where` that cannot broadcast to the variable is reported as such,
+        whether or not other constraints are valid.
+
+        >>> m = Grid1D(nx=4)
+        >>> v3 = CellVariable(mesh=m)
+        >>> v3.constrain(1., where=numerix.array([True, False, False]))
+        >>> v3.constrain(2., where=m.x > 3)
+        >>> print(v3.constraintMask)
+        Traceback (most recent call last):
+            ...
+        ValueError: `where` of shape (3,) cannot broadcast to constraint mask shape (4,)
+
         """
         if not hasattr(self, '_constraintMask'):
             from fipy.variables.constraintMask import _ConstraintMask